@@ -1,9 +1,14 @@
+import functools
+from collections import OrderedDict
+
+import numpy as np
 import pytest
 from pydantic import ValidationError
 from gest_api.vocs import (
     ContinuousVariable,
     DiscreteVariable,
     VOCS,
+    BaseConstraint,
     BoundsConstraint,
     GreaterThanConstraint,
     LessThanConstraint,
@@ -17,7 +22,7 @@ from gest_api.vocs import (
 
 def test_continuous_variable_success():
     var = ContinuousVariable(domain=[0.0, 1.0], default_value=0.5)
-    assert var.domain == [0.0, 1.0]
+    assert var.domain == (0.0, 1.0)
     assert var.default_value == 0.5
 
 
@@ -116,7 +121,7 @@ def test_adding_variables():
     v = VOCS(variables={"x": [0.0, 1.0]}, objectives={})
     v.variables["y"] = [0.0, 2.0]
     assert isinstance(v.variables["y"], ContinuousVariable)
-    assert v.variables["y"].domain == [0.0, 2.0]
+    assert v.variables["y"].domain == (0.0, 2.0)
 
     with pytest.raises(ValueError, match="not supported"):
         v.variables["z"] = 5.0
@@ -172,7 +177,7 @@ def test_vocs_1():
         observables=["temp", "temp2"],
     )
     assert isinstance(vocs.variables["x"], ContinuousVariable)
-    assert vocs.variables["x"].domain == [0.5, 1.0]
+    assert vocs.variables["x"].domain == (0.5, 1.0)
     assert isinstance(vocs.objectives["f"], MinimizeObjective)
     assert vocs.constants["alpha"].value == 1.0
     assert vocs.constants["beta"].value == 2.0
@@ -252,7 +257,7 @@ def check_constraints(vocs):
     assert isinstance(vocs.constraints["c1"], LessThanConstraint)
     assert vocs.constraints["c1"].value == 2.0
     assert isinstance(vocs.constraints["c2"], BoundsConstraint)
-    assert vocs.constraints["c2"].range == [-1.0, 1.0]
+    assert vocs.constraints["c2"].range == (-1.0, 1.0)
 
 
 def test_vocs_3():
@@ -527,3 +532,402 @@ def test_n_outputs_property():
         observables=["temp"],
     )
     assert vocs.n_outputs == 5
+
+
+def test_name_properties_cached():
+    vocs = VOCS(
+        variables={"x": [0, 1]},
+        objectives={"f1": "MINIMIZE"},
+        constraints={"c1": ["LESS_THAN", 0.0]},
+    )
+    assert vocs.all_names == ["x", "f1", "c1"]
+
+    # callers get their own list and can modify it
+    vocs.variable_names.append("zzz")
+    vocs.output_names.append("zzz")
+    vocs.all_names.append("zzz")
+    assert vocs.variable_names == ["x"]
+    assert vocs.output_names == ["f1", "c1"]
+    assert vocs.all_names == ["x", "f1", "c1"]
+    assert vocs.n_outputs == 2
+
+
+def test_name_properties_invalidated():
+    vocs = VOCS(variables={"x": [0, 1]}, objectives={"f1": "MINIMIZE"})
+    assert vocs.all_names == ["x", "f1"]
+
+    # mutating one of the dicts in place
+    vocs.variables["y"] = [0, 2]
+    vocs.constraints["c1"] = ["LESS_THAN", 0.0]
+    assert vocs.variable_names == ["x", "y"]
+    assert vocs.output_names == ["f1", "c1"]
+    assert vocs.all_names == ["x", "y", "f1", "c1"]
+
+    del vocs.variables["x"]
+    vocs.objectives.pop("f1")
+    assert vocs.all_names == ["y", "c1"]
+
+    # reassigning a field
+    vocs.variables = {"z": [0, 1]}
+    vocs.observables = ["temp"]
+    assert vocs.variable_names == ["z"]
+    assert vocs.all_names == ["z", "c1", "temp"]
+    assert vocs.n_outputs == 2
+
+
+def test_cache_not_shared_with_copies():
+    vocs = VOCS(variables={"x": [0, 1]})
+    assert vocs.variable_names == ["x"]
+
+    vocs_copy = vocs.model_copy(deep=True)
+    vocs_copy.variables["y"] = [0, 1]
+    assert vocs.variable_names == ["x"]
+    assert vocs_copy.variable_names == ["x", "y"]
+    assert vocs_copy != vocs
+    assert VOCS.model_validate(vocs.model_dump()) == vocs
+
+
+def test_output_names_deduplicated():
+    vocs = VOCS(
+        variables={"x": [0, 1]},
+        objectives={"f1": "MINIMIZE", "f2": "MAXIMIZE"},
+        constraints={"f2": ["LESS_THAN", 0.0], "c1": ["LESS_THAN", 0.0]},
+        observables=["c1", "f1", "temp"],
+    )
+    assert vocs.output_names == ["f1", "f2", "c1", "temp"]
+    assert vocs.n_outputs == 4
+
+
+def test_validated_dict_copies_validated_entries():
+    vocs = VOCS(variables={"x": [0, 1], "y": {"a", "b"}}, constants={"alpha": 1.0})
+    vocs2 = VOCS(variables=vocs.variables, constants=vocs.constants)
+    assert vocs2.variables is not vocs.variables
+    assert vocs2.variables["x"] is vocs.variables["x"]
+    assert vocs2.constants["alpha"] is vocs.constants["alpha"]
+    assert vocs2 == vocs
+
+    # mixed inputs still go through per-entry validation
+    vocs2.variables.update({"x": vocs.variables["x"], "z": [0.0, 2.0]})
+    assert isinstance(vocs2.variables["z"], ContinuousVariable)
+    assert vocs2.variable_names == ["x", "y", "z"]
+
+
+def test_typed_dict_entries_restricted_to_field_classes():
+    with pytest.raises(ValueError, match="not available"):
+        VOCS(variables={"x": {"type": "VOCS", "variables": {}}})
+
+    with pytest.raises(ValueError, match="not a valid variable"):
+        VOCS(variables={"x": {"type": "LessThanConstraint", "value": 1.0}})
+
+    with pytest.raises(ValueError, match="not a valid constraint"):
+        VOCS(
+            variables={"x": [0, 1]},
+            constraints={"c": {"type": "ContinuousVariable", "domain": [0, 1]}},
+        )
+
+
+def test_constraint_check_batch():
+    x = np.array([-2.0, -1.0, 0.0, 1.0, 2.0])
+    lt = LessThanConstraint(value=0.0)
+    gt = GreaterThanConstraint(value=0.0)
+    bounds = BoundsConstraint(range=[-1.0, 1.0])
+
+    assert lt.check_batch(x).tolist() == [lt.check(v) for v in x]
+    assert gt.check_batch(x).tolist() == [gt.check(v) for v in x]
+    assert bounds.check_batch(x).tolist() == [bounds.check(v) for v in x]
+
+
+def test_evaluate_constraints():
+    vocs = VOCS(
+        variables={"x": [0, 1]},
+        constraints={
+            "c1": ["GREATER_THAN", 0.0],
+            "c2": ["LESS_THAN", 2.0],
+            "c3": ["BOUNDS", -1.0, 1.0],
+        },
+    )
+    results = np.array([[1.0, 1.0, 0.0], [-1.0, 3.0, 2.0]])
+    satisfied = vocs.evaluate_constraints(results)
+    assert satisfied.tolist() == [[True, True, True], [False, False, False]]
+    assert satisfied.all(axis=1).tolist() == [True, False]
+
+    # subset of constraints in a different order
+    satisfied = vocs.evaluate_constraints([[2.0, 0.5], [0.0, 0.5]], names=["c3", "c1"])
+    assert satisfied.tolist() == [[False, True], [True, True]]
+
+    with pytest.raises(ValueError, match="must have shape"):
+        vocs.evaluate_constraints(np.zeros((2, 2)))
+
+
+def test_bounds_array_property():
+    vocs = VOCS(variables={"x": [0, 1], "y": [2, 4]})
+    bounds = vocs.bounds_array
+    assert bounds.shape == (2, 2)
+    assert bounds.dtype == np.float64
+    assert bounds.flags.c_contiguous
+    assert bounds.tolist() == [[0.0, 1.0], [2.0, 4.0]]
+    assert vocs.bounds_array is bounds
+
+    with pytest.raises(ValueError):
+        bounds[0, 0] = 5.0
+
+    vocs.variables["z"] = [-1, 1]
+    assert vocs.bounds_array.tolist() == [[0.0, 1.0], [2.0, 4.0], [-1.0, 1.0]]
+    assert vocs.bounds == [[0, 1], [2, 4], [-1, 1]]
+
+
+def test_validated_dict_mapping_interface():
+    vocs = VOCS(variables={"x": [0, 1]}, observables=["temp"])
+    assert not hasattr(vocs.variables, "__dict__")
+    assert vocs.variables == {"x": vocs.variables["x"]}
+    assert "x" in vocs.variables and len(vocs.variables) == 1
+
+    # a validated dict can be passed back in for any field
+    vocs2 = VOCS(variables=vocs.variables, observables=vocs.observables)
+    assert vocs2 == vocs
+
+    variables = vocs.variables.copy()
+    assert type(variables) is type(vocs.variables)
+    assert variables == vocs.variables and variables is not vocs.variables
+    variables["y"] = [0.0, 2.0]
+    assert isinstance(variables["y"], ContinuousVariable)
+    assert "y" not in vocs.variables
+
+    vocs2.variables.setdefault("y", [0.0, 2.0])
+    assert isinstance(vocs2.variables["y"], ContinuousVariable)
+    vocs2.variables.clear()
+    assert vocs2.variable_names == []
+
+
+def test_constant_and_observable_shorthand_match_validated():
+    vocs = VOCS(
+        variables={"x": [0, 1]},
+        constants={"alpha": 1.0, "beta": 2, "name": "abc"},
+        observables=["temp"],
+    )
+    assert vocs.constants["alpha"] == Constant(value=1.0)
+    assert vocs.constants["beta"] == Constant(value=2)
+    assert vocs.constants["name"] == Constant(value="abc")
+    assert vocs.observables["temp"] == Observable()
+    assert VOCS.model_validate(vocs.model_dump()) == vocs
+
+
+def test_vocs_clone():
+    vocs = VOCS(variables={"x": [0, 1]}, objectives={"f": "MINIMIZE"})
+    assert vocs.variable_names == ["x"]
+
+    vocs_clone = vocs.clone()
+    assert vocs_clone == vocs
+    assert vocs_clone.model_fields_set == vocs.model_fields_set
+    assert vocs_clone.variables is not vocs.variables
+    assert vocs_clone.variables["x"] is vocs.variables["x"]
+
+    vocs_clone.variables["y"] = [0, 2]
+    assert vocs.variable_names == ["x"]
+    assert vocs_clone.variable_names == ["x", "y"]
+
+
+def test_vocs_from_validated():
+    vocs = VOCS(variables={"x": [0, 1]}, objectives={"f": "MINIMIZE"})
+    sub = VOCS.from_validated(variables=vocs.variables)
+    assert sub.variables is vocs.variables
+    assert sub.objective_names == []
+    assert sub.output_names == []
+
+    with pytest.raises(TypeError, match="field variables must be a VariableDict"):
+        VOCS.from_validated(variables={"x": [0, 1]})
+
+    with pytest.raises(TypeError, match="field variables must be a VariableDict"):
+        VOCS.from_validated(variables=vocs.objectives)
+
+    with pytest.raises(TypeError, match="foo is not a VOCS field"):
+        VOCS.from_validated(variables=vocs.variables, foo=vocs.variables)
+
+    with pytest.raises(TypeError, match="field variables is required"):
+        VOCS.from_validated(objectives=vocs.objectives)
+
+
+def test_objective_strings_share_singletons():
+    vocs = VOCS(
+        variables={"x": [0, 1]},
+        objectives={"f1": "MINIMIZE", "f2": "minimize", "f3": "MAXIMIZE"},
+    )
+    assert vocs.objectives["f1"] is vocs.objectives["f2"]
+    assert (
+        vocs.objectives["f3"]
+        is VOCS(variables={"x": [0, 1]}, objectives={"g": "MAXIMIZE"}).objectives["g"]
+    )
+
+    with pytest.raises(ValidationError, match="frozen"):
+        vocs.objectives["f1"].dtype = "float"
+
+
+def test_serialization_type_tags():
+    class MyVariable(ContinuousVariable):
+        pass
+
+    vocs = VOCS(
+        variables={"x": [0, 1], "y": MyVariable(domain=[0, 1])},
+        objectives={"f": "MINIMIZE"},
+        constants={"alpha": 1.0},
+        observables=["temp"],
+    )
+    model = vocs.model_dump()
+    assert model["variables"]["x"] == {
+        "dtype": None,
+        "default_value": None,
+        "domain": (0.0, 1.0),
+        "type": "ContinuousVariable",
+    }
+    assert model["variables"]["y"]["type"] == "MyVariable"
+    assert model["objectives"]["f"] == {"dtype": None, "type": "MinimizeObjective"}
+    assert model["constants"]["alpha"] == {
+        "dtype": None,
+        "value": 1.0,
+        "type": "Constant",
+    }
+    assert model["observables"]["temp"] == {"dtype": None, "type": "Observable"}
+
+
+def test_variable_shorthand_validation():
+    vocs = VOCS(variables={"x": [0, 1], "y": {"a", "b"}})
+    assert vocs.variables["x"] == ContinuousVariable(domain=[0, 1])
+    assert vocs.variables["y"] == DiscreteVariable(values={"a", "b"})
+    assert type(vocs.variables["x"].domain) is tuple
+    assert type(vocs.variables["y"].values) is frozenset
+
+    with pytest.raises(ValidationError, match="value\\[1\\] > value\\[0\\]"):
+        vocs.variables["x"] = [1, 0]
+
+    with pytest.raises(ValidationError):
+        VOCS(variables={"x": ["a", 1]})
+
+    with pytest.raises(ValidationError, match="at least 1 item"):
+        VOCS(variables={"x": set()})
+
+
+def test_entry_subclass_inputs():
+    class Bounds(list):
+        pass
+
+    class MyConstraint(LessThanConstraint):
+        pass
+
+    vocs = VOCS(
+        variables={"x": Bounds([0, 1])},
+        constraints={"c": MyConstraint(value=1.0)},
+        objectives={"f": OrderedDict(type="MinimizeObjective")},
+        constants={"flag": True},
+    )
+    assert isinstance(vocs.variables["x"], ContinuousVariable)
+    assert isinstance(vocs.constraints["c"], MyConstraint)
+    assert isinstance(vocs.objectives["f"], MinimizeObjective)
+    assert vocs.constants["flag"].value is True
+
+
+def test_constraints_frozen_and_hashable():
+    bounds = BoundsConstraint(range=[-1.0, 1.0])
+    assert bounds.range == (-1.0, 1.0)
+    assert hash(bounds) == hash(BoundsConstraint(range=(-1.0, 1.0)))
+    assert len({LessThanConstraint(value=1.0), LessThanConstraint(value=1.0)}) == 1
+
+    with pytest.raises(ValidationError, match="frozen"):
+        bounds.range = (0.0, 2.0)
+
+    calls = []
+
+    @functools.cache
+    def check(constraint, x):
+        calls.append(x)
+        return constraint.check(x)
+
+    assert check(bounds, 0.5) and check(BoundsConstraint(range=[-1.0, 1.0]), 0.5)
+    assert calls == [0.5]
+
+
+def test_entries_frozen():
+    vocs = VOCS(
+        variables={"x": [0, 1]}, constants={"alpha": 1.0}, observables=["a", "b"]
+    )
+    with pytest.raises(ValidationError, match="frozen"):
+        vocs.variables["x"].default_value = 0.5
+    with pytest.raises(ValidationError, match="frozen"):
+        vocs.constants["alpha"].value = 2.0
+
+    # entries given by name only share one instance
+    assert vocs.observables["a"] is vocs.observables["b"]
+
+
+def test_variable_arrays_property():
+    vocs = VOCS(
+        variables={
+            "x": [0, 1],
+            "y": ContinuousVariable(domain=[2, 4], default_value=3.0),
+        }
+    )
+    arrays = vocs.variable_arrays
+    assert arrays.names == ("x", "y")
+    assert arrays.lows.tolist() == [0.0, 2.0]
+    assert arrays.highs.tolist() == [1.0, 4.0]
+    assert np.isnan(arrays.defaults[0]) and arrays.defaults[1] == 3.0
+    assert vocs.variable_arrays is arrays
+    for array in (arrays.lows, arrays.highs, arrays.defaults):
+        assert array.flags.c_contiguous
+
+    with pytest.raises(ValueError):
+        arrays.lows[0] = -1.0
+
+    clipped = np.clip(np.array([[-1.0, 5.0]]), arrays.lows, arrays.highs)
+    assert clipped.tolist() == [[0.0, 4.0]]
+
+    vocs.variables["z"] = [-1, 1]
+    assert vocs.variable_arrays.names == ("x", "y", "z")
+    assert vocs.variable_arrays.lows.tolist() == [0.0, 2.0, -1.0]
+
+
+def test_evaluate_constraints_custom_constraint():
+    class EvenConstraint(BaseConstraint):
+        def check(self, x: float) -> bool:
+            return x % 2 == 0
+
+    vocs = VOCS(variables={"x": [0, 1]}, constraints={"c": EvenConstraint()})
+    assert vocs.evaluate_constraints([[2.0], [3.0]]).tolist() == [[True], [False]]
+    assert EvenConstraint().check_batch(np.array([[2.0, 3.0]])).tolist() == [
+        [True, False]
+    ]
+
+
+def test_bounds_returns_new_list():
+    vocs = VOCS(variables={"x": [0, 1]})
+    vocs.bounds[0][0] = 99.0
+    assert vocs.bounds == [[0.0, 1.0]]
+
+
+def test_variables_immutable():
+    vocs = VOCS(variables={"x": [0, 1], "y": {"a", "b"}})
+    with pytest.raises(TypeError):
+        vocs.variables["x"].domain[1] = 5.0
+    with pytest.raises(AttributeError):
+        vocs.variables["y"].values.add("c")
+
+    assert vocs.variables["y"].values == {"a", "b"}
+    assert hash(vocs.variables["x"]) == hash(ContinuousVariable(domain=[0, 1]))
+    assert hash(vocs.variables["y"]) == hash(DiscreteVariable(values={"a", "b"}))
+
+
+def test_bounds_caches_follow_variable_changes():
+    vocs = VOCS(variables={"x": [0, 1]})
+    assert vocs.bounds == [[0.0, 1.0]]
+
+    # entries cannot be changed behind the cache's back...
+    with pytest.raises(TypeError):
+        vocs.variables["x"].domain[1] = 5.0
+    with pytest.raises(ValidationError, match="frozen"):
+        vocs.variables["x"].domain = (0.0, 5.0)
+    assert vocs.bounds == [[0.0, 1.0]]
+
+    # ...only replaced, which refreshes every cached view of the bounds
+    vocs.variables["x"] = [0, 5]
+    assert vocs.bounds == [[0.0, 5.0]]
+    assert vocs.bounds_array.tolist() == [[0.0, 5.0]]
+    assert vocs.variable_arrays.highs.tolist() == [5.0]
@@ -1,18 +1,24 @@
-from abc import ABC, abstractmethod
-from typing import Any, Union, Optional, Tuple, Type
+from abc import abstractmethod
+from collections.abc import Mapping, MutableMapping
+from typing import Any, ClassVar, NamedTuple, Union, Optional, Tuple, Type
+import numpy as np
 from pydantic import (
-    conlist,
-    conset,
     Field,
     field_validator,
     model_validator,
     BaseModel,
     ConfigDict,
     field_serializer,
+    PrivateAttr,
 )
 
 
 class BaseField(BaseModel):
+    # entries are immutable (container fields are tuples/frozensets) so that they
+    # can be shared between VOCS objects (see VOCS.clone) and between entries of the
+    # same VOCS, and so that values derived from them can be cached
+    model_config = ConfigDict(frozen=True)
+
     dtype: Optional[Union[str, Type, Tuple]] = None
 
 
@@ -21,8 +27,8 @@ class BaseVariable(BaseField):
 
 
 class ContinuousVariable(BaseVariable):
-    domain: conlist(float, min_length=2, max_length=2) = Field(
-        description="domain of the variable, [min, max]"
+    domain: tuple[float, ...] = Field(
+        min_length=2, max_length=2, description="domain of the variable, (min, max)"
     )
 
     @model_validator(mode="after")
@@ -36,26 +42,88 @@ class ContinuousVariable(BaseVariable):
 
 
 class DiscreteVariable(BaseVariable):
-    values: conset(Any, min_length=1) = Field(
-        description="List of allowed discrete values"
+    values: frozenset[Any] = Field(
+        min_length=1, description="Set of allowed discrete values"
     )
 
 
-class ValidatedDict(dict, ABC):
+def _as_is(name, val):
+    return val
+
+
+class ValidatedDict(MutableMapping):
+    # entries are kept in `_data`; `_version` is bumped on every mutation so that
+    # VOCS can tell when cached values are stale
+    __slots__ = ("_data", "_version")
+    # entries of this type are already validated and are stored as they are
+    _entry_type: type
+    # maps the exact type of an input value to the function converting it into an
+    # entry; values of any other type (e.g. subclasses) go through `_validate_entry`
+    _dispatch: ClassVar[dict] = {}
+
     def __init__(self, *args, **kwargs):
         raw = dict(*args, **kwargs)  # collect initial data
-        super().__init__()  # start with empty dict
-        for k, v in raw.items():
-            self[k] = v  # <- goes through __setitem__, runs validation
+        self._data = {}  # start with empty dict
+        self._version = 0
+        self._set_entries(raw)
 
     def update(self, *args, **kwargs):
-        for key, value in dict(*args, **kwargs).items():
-            self[key] = value  # will trigger __setitem__
+        self._set_entries(dict(*args, **kwargs))
+
+    def _set_entries(self, raw):
+        if all(isinstance(v, self._entry_type) for v in raw.values()):
+            # e.g. copying another ValidatedDict, skip the per-entry dispatch
+            self._data.update(raw)
+            self._version += 1
+        else:
+            for k, v in raw.items():
+                self[k] = v  # <- goes through __setitem__, runs validation
+
+    def setdefault(self, key, default=None):
+        if key not in self._data:
+            self[key] = default
+        return self._data[key]
 
     def __setitem__(self, key, value):
         """update dict item to do validation on set"""
-        value = self._validate_entry(key, value)
-        super().__setitem__(key, value)
+        handler = self._dispatch.get(type(value))
+        if handler is None:
+            value = self._validate_entry(key, value)
+        else:
+            value = handler(key, value)
+        self._data[key] = value
+        self._version += 1
+
+    def __delitem__(self, key):
+        del self._data[key]
+        self._version += 1
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def keys(self):
+        return self._data.keys()
+
+    def values(self):
+        return self._data.values()
+
+    def items(self):
+        return self._data.items()
+
+    def __repr__(self):
+        return repr(self._data)
+
+    def copy(self):
+        return type(self)(self)
 
     @staticmethod
     @abstractmethod
@@ -63,27 +131,51 @@ class ValidatedDict(dict, ABC):
 
 
 class VariableDict(ValidatedDict):
+    __slots__ = ()
+    _entry_type = BaseVariable
+
+    @staticmethod
+    def _from_list(name, val):
+        if len(val) != 2:
+            raise ValueError(
+                f"variable {name} is not correctly specified, must have two elements representing upper and lower bounds."
+            )
+        return ContinuousVariable(domain=tuple(val))
+
+    @staticmethod
+    def _from_set(name, val):
+        return DiscreteVariable(values=frozenset(val))
+
+    @staticmethod
+    def _from_dict(name, val):
+        if "type" not in val:
+            raise ValueError(f"variable {name} must provide type field")
+        variable_type = val.pop("type")
+        class_ = FIELD_CLASSES.get(variable_type)
+        if class_ is None:
+            raise ValueError(f"variable type {variable_type} is not available")
+        if not issubclass(class_, BaseVariable):
+            raise ValueError(f"variable type {variable_type} is not a valid variable")
+        return class_(**val)
+
+    _dispatch: ClassVar[dict] = {
+        ContinuousVariable: _as_is,
+        DiscreteVariable: _as_is,
+        list: _from_list,
+        set: _from_set,
+        dict: _from_dict,
+    }
+
     @staticmethod
     def _validate_entry(name, val):
         if isinstance(val, BaseVariable):
             return val
         elif isinstance(val, list):
-            if len(val) != 2:
-                raise ValueError(
-                    f"variable {name} is not correctly specified, must have two elements representing upper and lower bounds."
-                )
-            return ContinuousVariable(domain=val)
+            return VariableDict._from_list(name, val)
         elif isinstance(val, set):
-            return DiscreteVariable(values=val)
+            return VariableDict._from_set(name, val)
         elif isinstance(val, dict):
-            if "type" not in val:
-                raise ValueError(f"variable {name} must provide type field")
-            variable_type = val.pop("type")
-            try:
-                class_ = globals()[variable_type]
-            except KeyError:
-                raise ValueError(f"variable type {variable_type} is not available")
-            return class_(**val)
+            return VariableDict._from_dict(name, val)
         else:
             raise ValueError(
                 f"variable {name}: input type {type(val)} not supported. "
@@ -92,7 +184,12 @@ class VariableDict(ValidatedDict):
 
 
 class BaseConstraint(BaseField):
-    pass
+    def check_batch(self, x: np.ndarray) -> np.ndarray:
+        """Vectorized version of ``check`` returning a boolean array shaped like ``x``."""
+        # element-wise fallback for constraints that only define `check`
+        return np.fromiter(map(self.check, np.ravel(x)), dtype=bool).reshape(
+            np.shape(x)
+        )
 
 
 class LessThanConstraint(BaseConstraint):
@@ -101,6 +198,9 @@ class LessThanConstraint(BaseConstraint):
     def check(self, x: float) -> bool:
         return x < self.value
 
+    def check_batch(self, x: np.ndarray) -> np.ndarray:
+        return np.less(x, self.value)
+
 
 class GreaterThanConstraint(BaseConstraint):
     value: float
@@ -108,10 +208,13 @@ class GreaterThanConstraint(BaseConstraint):
     def check(self, x: float) -> bool:
         return x > self.value
 
+    def check_batch(self, x: np.ndarray) -> np.ndarray:
+        return np.greater(x, self.value)
+
 
 class BoundsConstraint(BaseConstraint):
-    range: conlist(float, min_length=2, max_length=2) = Field(
-        description="range of the constraint [min, max]"
+    range: tuple[float, ...] = Field(
+        min_length=2, max_length=2, description="range of the constraint (min, max)"
     )
 
     @field_validator("range")
@@ -124,6 +227,11 @@ class BoundsConstraint(BaseConstraint):
         lo, hi = self.range
         return lo <= x <= hi  # open both ends
 
+    def check_batch(self, x: np.ndarray) -> np.ndarray:
+        lo, hi = self.range
+        x = np.asarray(x)
+        return (x >= lo) & (x <= hi)
+
 
 CONSTRAINT_CLASSES = {
     "LESS_THAN": LessThanConstraint,
@@ -133,39 +241,60 @@ CONSTRAINT_CLASSES = {
 
 
 class ConstraintDict(ValidatedDict):
+    __slots__ = ()
+    _entry_type = BaseConstraint
+
+    @staticmethod
+    def _from_dict(name, val):
+        if "type" not in val:
+            raise ValueError(f"constraint {name} must provide type field")
+        constraint_type = val.pop("type")
+        class_ = FIELD_CLASSES.get(constraint_type)
+        if class_ is None:
+            raise ValueError(f"constraint type {constraint_type} is not available")
+        if not issubclass(class_, BaseConstraint):
+            raise ValueError(
+                f"constraint type {constraint_type} is not a valid constraint"
+            )
+        return class_(**val)
+
+    @staticmethod
+    def _from_list(name, val):
+        if not isinstance(val[0], str):
+            raise ValueError(
+                f"constraint type {val[0]} must be a string if specified by a list"
+            )
+
+        constraint_type = val[0].upper()
+        if constraint_type not in CONSTRAINT_CLASSES:
+            raise ValueError(
+                f"Constraint type '{constraint_type}' is not supported for '{name}'."
+            )
+
+        # Dynamically create the constraint instance
+        if constraint_type == "BOUNDS":
+            return CONSTRAINT_CLASSES[constraint_type](range=val[1:])
+        else:
+            if len(val) < 2:
+                raise ValueError(f"constraint {val} is not correctly specified")
+            return CONSTRAINT_CLASSES[constraint_type](value=val[1])
+
+    _dispatch: ClassVar[dict] = {
+        LessThanConstraint: _as_is,
+        GreaterThanConstraint: _as_is,
+        BoundsConstraint: _as_is,
+        dict: _from_dict,
+        list: _from_list,
+    }
+
     @staticmethod
     def _validate_entry(name, val):
         if isinstance(val, BaseConstraint):
             return val
         elif isinstance(val, dict):
-            if "type" not in val:
-                raise ValueError(f"constraint {name} must provide type field")
-            constraint_type = val.pop("type")
-            try:
-                class_ = globals()[constraint_type]
-            except KeyError:
-                raise ValueError(f"constraint type {constraint_type} is not available")
-            return class_(**val)
+            return ConstraintDict._from_dict(name, val)
         elif isinstance(val, list):
-            if not isinstance(val[0], str):
-                raise ValueError(
-                    f"constraint type {val[0]} must be a string if specified by a list"
-                )
-
-            constraint_type = val[0].upper()
-            if constraint_type not in CONSTRAINT_CLASSES:
-                raise ValueError(
-                    f"Constraint type '{constraint_type}' is not supported for '{name}'."
-                )
-
-            # Dynamically create the constraint instance
-            if constraint_type == "BOUNDS":
-                return CONSTRAINT_CLASSES[constraint_type](range=val[1:])
-            else:
-                if len(val) < 2:
-                    raise ValueError(f"constraint {val} is not correctly specified")
-                return CONSTRAINT_CLASSES[constraint_type](value=val[1])
-
+            return ConstraintDict._from_list(name, val)
         else:
             raise ValueError(f"constraint input type {type(val)} not supported")
 
@@ -192,32 +321,59 @@ OBJECTIVE_CLASSES = {
     "EXPLORE": ExploreObjective,
 }
 
+MINIMIZE = MinimizeObjective()
+MAXIMIZE = MaximizeObjective()
+EXPLORE = ExploreObjective()
+
+# shared instances used for objectives given by name
+OBJECTIVE_SINGLETONS = {
+    "MINIMIZE": MINIMIZE,
+    "MAXIMIZE": MAXIMIZE,
+    "EXPLORE": EXPLORE,
+}
+
 
 class ObjectiveDict(ValidatedDict):
+    __slots__ = ()
+    _entry_type = BaseObjective
+
+    @staticmethod
+    def _from_dict(name, val):
+        if "type" not in val:
+            raise ValueError(f"objective {name} is not correctly specified")
+        objective_type = val.pop("type")
+        class_ = FIELD_CLASSES.get(objective_type)
+        if class_ is None:
+            raise ValueError(f"objective type {objective_type} is not available")
+        if not issubclass(class_, BaseObjective):
+            raise ValueError(
+                f"objective type {objective_type} is not a valid objective"
+            )
+        return class_(**val)
+
+    @staticmethod
+    def _from_str(name, val):
+        try:
+            return OBJECTIVE_SINGLETONS[val.upper()]
+        except KeyError:
+            raise ValueError(f"Objective type '{val}' is not supported for '{name}'.")
+
+    _dispatch: ClassVar[dict] = {
+        MinimizeObjective: _as_is,
+        MaximizeObjective: _as_is,
+        ExploreObjective: _as_is,
+        dict: _from_dict,
+        str: _from_str,
+    }
+
     @staticmethod
     def _validate_entry(name, val):
         if isinstance(val, BaseObjective):
             return val
         elif isinstance(val, dict):
-            if "type" not in val:
-                raise ValueError(f"objective {name} is not correctly specified")
-            objective_type = val.pop("type")
-            try:
-                class_ = globals()[objective_type]
-                if not issubclass(class_, BaseObjective):
-                    raise ValueError(
-                        f"objective type {objective_type} is not a valid objective"
-                    )
-            except KeyError:
-                raise ValueError(f"objective type {objective_type} is not available")
-            return class_(**val)
+            return ObjectiveDict._from_dict(name, val)
         elif isinstance(val, str):
-            try:
-                return OBJECTIVE_CLASSES[val.upper()]()
-            except KeyError:
-                raise ValueError(
-                    f"Objective type '{val}' is not supported for '{name}'."
-                )
+            return ObjectiveDict._from_str(name, val)
         else:
             raise ValueError(f"objective input type {type(val)} not supported")
 
@@ -227,53 +383,142 @@ class Constant(BaseField):
 
 
 class ConstantDict(ValidatedDict):
+    __slots__ = ()
+    _entry_type = Constant
+
+    @staticmethod
+    def _from_dict(name, val):
+        if "type" not in val:
+            raise ValueError(f"constant {name} is not correctly specified")
+        constant_type = val.pop("type")
+
+        # we only have one constant type for now
+        if constant_type != "Constant":
+            raise ValueError(f"constant type {constant_type} is not a valid constant")
+
+        return Constant(**val)
+
+    @staticmethod
+    def _from_value(name, val):
+        return Constant(value=val)
+
+    _dispatch: ClassVar[dict] = {
+        Constant: _as_is,
+        dict: _from_dict,
+        float: _from_value,
+        int: _from_value,
+        str: _from_value,
+    }
+
     @staticmethod
     def _validate_entry(name, val):
         if isinstance(val, Constant):
             return val
         elif isinstance(val, dict):
-            if "type" not in val:
-                raise ValueError(f"constant {name} is not correctly specified")
-            constant_type = val.pop("type")
-
-            # we only have one constant type for now
-            if constant_type != "Constant":
-                raise ValueError(
-                    f"constant type {constant_type} is not a valid constant"
-                )
-
-            return Constant(**val)
+            return ConstantDict._from_dict(name, val)
         else:
-            return Constant(value=val)
+            return ConstantDict._from_value(name, val)
 
 
 class Observable(BaseField):
     pass
 
 
+# shared instance used for observables given by name only
+_UNTYPED_OBSERVABLE = Observable()
+
+
 class ObservableDict(ValidatedDict):
+    __slots__ = ()
+    _entry_type = Observable
+
+    @staticmethod
+    def _from_dict(name, val):
+        if "type" not in val:
+            raise ValueError(f"observable {name} is not correctly specified")
+        observable_type = val.pop("type")
+
+        # we only have one observable type for now
+        if observable_type != "Observable":
+            raise ValueError(
+                f"observable type {observable_type} is not a valid observable"
+            )
+
+        return Observable(**val)
+
+    @staticmethod
+    def _from_dtype(name, val):
+        return Observable(dtype=val)
+
+    _dispatch: ClassVar[dict] = {
+        Observable: _as_is,
+        dict: _from_dict,
+        str: _from_dtype,
+        type: _from_dtype,
+        tuple: _from_dtype,
+    }
+
     @staticmethod
     def _validate_entry(name, val):
         if isinstance(val, Observable):
             return val
         elif isinstance(val, dict):
-            if "type" not in val:
-                raise ValueError(f"observable {name} is not correctly specified")
-            observable_type = val.pop("type")
-
-            # we only have one observable type for now
-            if observable_type != "Observable":
-                raise ValueError(
-                    f"observable type {observable_type} is not a valid observable"
-                )
-
-            return Observable(**val)
+            return ObservableDict._from_dict(name, val)
         elif isinstance(val, (str, type, tuple)):
-            return Observable(dtype=val)
+            return ObservableDict._from_dtype(name, val)
         else:
             raise ValueError(f"observable input type {type(val)} not supported")
 
 
+class VariableArrays(NamedTuple):
+    """Per-variable settings of a VOCS as flat arrays, indexed like ``names``."""
+
+    names: tuple[str, ...]
+    lows: np.ndarray
+    highs: np.ndarray
+    # NaN where a variable has no default value
+    defaults: np.ndarray
+
+
+# classes that may be named in the "type" field of a serialized entry
+FIELD_CLASSES = {
+    cls.__name__: cls
+    for cls in (
+        ContinuousVariable,
+        DiscreteVariable,
+        LessThanConstraint,
+        GreaterThanConstraint,
+        BoundsConstraint,
+        MinimizeObjective,
+        MaximizeObjective,
+        ExploreObjective,
+        Constant,
+        Observable,
+    )
+}
+
+# serializer function and "type" tag for each field class
+_SERIALIZERS = {
+    cls: (cls.__pydantic_serializer__.to_python, name)
+    for name, cls in FIELD_CLASSES.items()
+}
+
+
+def _serialize_entries(entries):
+    output = {}
+    for name, val in entries.items():
+        cls = type(val)
+        try:
+            to_python, type_name = _SERIALIZERS[cls]
+        except KeyError:
+            # user-defined subclass
+            to_python, type_name = cls.__pydantic_serializer__.to_python, cls.__name__
+        data = to_python(val)
+        data["type"] = type_name
+        output[name] = data
+    return output
+
+
 class VOCS(BaseModel, validate_assignment=True, arbitrary_types_allowed=True):
     """
     Variables, Objectives, Constraints, and other Settings (VOCS) data structure
@@ -327,6 +572,10 @@ class VOCS(BaseModel, validate_assignment=True, arbitrary_types_allowed=True):
         validate_assignment=True, use_enum_values=True, extra="forbid"
     )
 
+    # derived values (output names, bounds arrays, ...) keyed by property name,
+    # see `_cached`
+    _cache: dict = PrivateAttr(default_factory=dict)
+
     @field_validator("variables", mode="before")
     def validate_variables(cls, v):
         return VariableDict(v)
@@ -347,30 +596,159 @@ class VOCS(BaseModel, validate_assignment=True, arbitrary_types_allowed=True):
     def validate_observables(cls, v):
         # allow a set/list of names for convenience
         if isinstance(v, set) or isinstance(v, list):
-            return ObservableDict({name: Observable() for name in v})
-        elif isinstance(v, dict):
+            return ObservableDict(dict.fromkeys(v, _UNTYPED_OBSERVABLE))
+        elif isinstance(v, Mapping):
             return ObservableDict(v)
         else:
             raise ValueError(f"observables input type {type(v)} not supported")
 
     @field_serializer("variables", "constraints", "objectives", "constants")
     def serialize_objects(self, v):
-        output = {}
-        for name, val in v.items():
-            output[name] = val.model_dump() | {"type": type(val).__name__}
-        return output
+        return _serialize_entries(v)
 
     @field_serializer("observables")
     def serialize_observables(self, v):
-        output = {}
-        for name, val in v.items():
-            output[name] = val.model_dump() | {"type": type(val).__name__}
-        return output
+        return _serialize_entries(v)
+
+    def __eq__(self, other):
+        # the cache of derived values is not part of the problem definition
+        if not isinstance(other, VOCS):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def _cached(self, key, fields, compute):
+        """
+        Return the cached value stored under ``key``, recomputing it with
+        ``compute()`` if any of the dicts in ``fields`` was reassigned or mutated
+        since it was cached. The entries themselves are immutable (see
+        ``BaseField``), so a change to a dict is the only way a value can go stale.
+        """
+        # read the fields and the cache directly, pydantic's attribute lookup is
+        # slower than the cheap derived values this is used for
+        values = self.__dict__
+        deps = tuple(values[name] for name in fields)
+        stamp = tuple((id(d), d._version) for d in deps)
+        cache = self.__pydantic_private__["_cache"]
+        entry = cache.get(key)
+        # the entry holds references to `deps`, so their ids cannot be reused
+        if entry is None or entry[1] != stamp:
+            entry = (deps, stamp, compute())
+            cache[key] = entry
+        return entry[2]
+
+    @classmethod
+    def from_validated(cls, **fields) -> "VOCS":
+        """
+        Create a VOCS from already validated fields without running the validators.
+
+        Each field must be given as the matching ``ValidatedDict`` (``VariableDict``,
+        ``ObjectiveDict``, ...), e.g. taken from another VOCS; the dicts are used as
+        they are, not copied. ``variables`` is required, the other fields take their
+        default when not given.
+        """
+        if "variables" not in fields:
+            raise TypeError("field variables is required")
+        for name, value in fields.items():
+            if name not in cls.model_fields:
+                raise TypeError(f"{name} is not a VOCS field")
+            expected = cls.model_fields[name].annotation
+            if not isinstance(value, expected):
+                raise TypeError(
+                    f"field {name} must be a {expected.__name__}, got {type(value)}"
+                )
+        return cls.model_construct(**fields)
+
+    def clone(self) -> "VOCS":
+        """
+        Return a copy of this VOCS that can be modified independently.
+
+        The field dicts are copied but the (validated) entries in them are shared,
+        so no validation is run.
+        """
+        return self.model_construct(
+            _fields_set=set(self.model_fields_set),
+            **{name: type(value)(value) for name, value in self},
+        )
+
+    def evaluate_constraints(
+        self, results: np.ndarray, names: list[str] | None = None
+    ) -> np.ndarray:
+        """
+        Check a batch of evaluated points against the constraints.
+
+        ``results`` is an ``(N, k)`` array holding the values of the ``k``
+        constraints in ``names`` (all constraints, in order, by default) for ``N``
+        points. Returns an ``(N, k)`` boolean array that is True where the
+        constraint is satisfied; use ``.all(axis=1)`` to get the feasible points.
+        """
+        if names is None:
+            names = self.constraint_names
+        results = np.asarray(results, dtype=np.float64)
+        if results.ndim != 2 or results.shape[1] != len(names):
+            raise ValueError(
+                f"results must have shape (N, {len(names)}), got {results.shape}"
+            )
+
+        satisfied = np.empty(results.shape, dtype=bool)
+        for j, name in enumerate(names):
+            satisfied[:, j] = self.constraints[name].check_batch(results[:, j])
+        return satisfied
 
     @property
     def bounds(self) -> list:
         """Return the domain bounds for all variables as a list of [lower, upper] pairs."""
-        return [v.domain for _, v in self.variables.items()]
+        return self.bounds_array.tolist()
+
+    @property
+    def bounds_array(self) -> np.ndarray:
+        """
+        Return the domain bounds for all variables as a read-only ``(n_variables, 2)``
+        float64 array, which can be passed to NumPy/SciPy without conversion.
+        """
+        return self._cached("bounds_array", ("variables",), self._compute_bounds_array)
+
+    def _compute_bounds_array(self) -> np.ndarray:
+        bounds = np.fromiter(
+            (b for v in self.variables.values() for b in v.domain),
+            dtype=np.float64,
+            count=2 * self.n_variables,
+        ).reshape(self.n_variables, 2)
+        # the array is shared between callers, so protect it from modification
+        bounds.flags.writeable = False
+        return bounds
+
+    @property
+    def variable_arrays(self) -> VariableArrays:
+        """
+        Return the names, lower and upper bounds and default values of all variables
+        as read-only float64 arrays, for vectorized use in generators, e.g.
+        ``np.clip(x, arrays.lows, arrays.highs)``.
+        """
+        return self._cached(
+            "variable_arrays", ("variables",), self._compute_variable_arrays
+        )
+
+    def _compute_variable_arrays(self) -> VariableArrays:
+        bounds = self.bounds_array
+        # separate contiguous copies rather than strided column views of `bounds`
+        lows = np.ascontiguousarray(bounds[:, 0])
+        highs = np.ascontiguousarray(bounds[:, 1])
+        defaults = np.fromiter(
+            (
+                np.nan if v.default_value is None else v.default_value
+                for v in self.variables.values()
+            ),
+            dtype=np.float64,
+            count=self.n_variables,
+        )
+        for array in (lows, highs, defaults):
+            array.flags.writeable = False
+        return VariableArrays(
+            names=tuple(self.variables.keys()),
+            lows=lows,
+            highs=highs,
+            defaults=defaults,
+        )
 
     @property
     def variable_names(self) -> list[str]:
@@ -395,16 +773,20 @@ class VOCS(BaseModel, validate_assignment=True, arbitrary_types_allowed=True):
     @property
     def output_names(self) -> list[str]:
         """Return a list of all output names (objectives, constraints, and observables)."""
-        full_list = self.objective_names
-        for ele in self.constraint_names:
-            if ele not in full_list:
-                full_list += [ele]
-
-        for ele in self.observable_names:
-            if ele not in full_list:
-                full_list += [ele]
-
-        return full_list
+        # the cached list is copied so callers can modify the result
+        return list(self._output_names())
+
+    def _output_names(self) -> list[str]:
+        # dict.fromkeys drops duplicate names while preserving their first position
+        return self._cached(
+            "output_names",
+            ("objectives", "constraints", "observables"),
+            lambda: list(
+                dict.fromkeys(
+                    self.objective_names + self.constraint_names + self.observable_names
+                )
+            ),
+        )
 
     @property
     def constant_names(self) -> list[str]:
@@ -414,7 +796,15 @@ class VOCS(BaseModel, validate_assignment=True, arbitrary_types_allowed=True):
     @property
     def all_names(self) -> list[str]:
         """Return a list of all names (variables, constants, and outputs)."""
-        return self.variable_names + self.constant_names + self.output_names
+        return list(
+            self._cached(
+                "all_names",
+                ("variables", "constants", "objectives", "constraints", "observables"),
+                lambda: (
+                    self.variable_names + self.constant_names + self._output_names()
+                ),
+            )
+        )
 
     @property
     def n_variables(self) -> int:
@@ -449,4 +839,4 @@ class VOCS(BaseModel, validate_assignment=True, arbitrary_types_allowed=True):
     @property
     def n_outputs(self) -> int:
         """Return the total number of outputs (objectives + constraints + observables)."""
-        return len(self.output_names)
+        return len(self._output_names())